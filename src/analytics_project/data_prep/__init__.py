@@ -0,0 +1,3 @@
+# __init__.py
+# This file is needed to mark this directory as a Python package.
+# It can be left empty or used to set package-level variables.
@@ -0,0 +1,6 @@
+"""Run the generic cleaner via `python -m analytics_project.data_prep`."""
+
+from analytics_project.data_prep.clean_all import main
+
+if __name__ == "__main__":
+    main()
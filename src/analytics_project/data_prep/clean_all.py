@@ -0,0 +1,89 @@
+"""
+clean_all.py
+
+Generic scrub of every raw CSV with DataScrubber: dedup, fill missing
+strings, normalize column names and string values. The per-file
+prepare_*_data.py scripts do the detailed, column-aware cleaning.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import pandas as pd
+
+from analytics_project.data_scrubber import DataScrubber
+from analytics_project.paths import prepared_data_dir, raw_data_dir
+
+# Resolved and mkdir'd once per process
+RAW_DIR = raw_data_dir()
+PREPARED_DIR = prepared_data_dir()
+
+
+def clean_with_scrubber(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Clean any DataFrame safely:
+    - Preserve numeric columns (including IDs)
+    - Fill missing string/object columns with "UNKNOWN"
+    - Remove duplicates and clean strings
+    """
+    scrubber = DataScrubber(df)
+
+    # Remove duplicate records
+    df = scrubber.remove_duplicate_records()
+
+    # Fill missing string columns manually
+    for col in df.select_dtypes(include=["object", "string", "str"]).columns:
+        df[col] = df[col].fillna("UNKNOWN")  # safe for strings only
+
+    # Clean column names (list comprehension — column counts are tiny)
+    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+
+    # Uppercase and trim string columns with vectorized .str kernels
+    for col in df.select_dtypes(include=["object", "string", "str"]).columns:
+        df[col] = df[col].str.strip().str.upper()
+
+    return df
+
+
+# Rows per streamed chunk — bounds peak memory at roughly one chunk
+CHUNK_ROWS = 200_000
+
+
+def clean_file(filename: str):
+    input_path = RAW_DIR / filename
+    output_path = PREPARED_DIR / filename.replace("_data.csv", "_prepared.csv")
+
+    if not input_path.exists():
+        print(f" File not found: {input_path}")
+        return
+
+    print(f" Processing: {filename}")
+
+    # Stream the file in chunks so peak memory scales with the chunk
+    # size, not the file size. Chunked reads need the C engine (the
+    # pyarrow engine cannot iterate); duplicate removal is per-chunk.
+    # dtype_backend="pyarrow" keeps strings in contiguous Arrow buffers
+    # so the .str cleanup dispatches to Arrow compute kernels.
+    for i, chunk in enumerate(
+        pd.read_csv(input_path, chunksize=CHUNK_ROWS, dtype_backend="pyarrow")
+    ):
+        cleaned = clean_with_scrubber(chunk)
+        cleaned.to_csv(output_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+
+    print(f" Saved cleaned file to: {output_path}")
+
+
+# List of all CSVs to clean
+files_to_clean = ["customers_data.csv", "products_data.csv", "sales_data.csv"]
+
+def main() -> None:
+    """Clean all raw CSVs in parallel — the files are independent, so wall
+    clock becomes the slowest file instead of the sum of all three."""
+    with ProcessPoolExecutor(max_workers=min(3, os.cpu_count() or 1)) as executor:
+        list(executor.map(clean_file, files_to_clean))
+
+    print(" All files cleaned successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,60 +17,56 @@ Tasks:
 # Imports
 #####################################
 
-import pathlib
-import sys
+import numpy as np
 import pandas as pd
 
-#####################################
-# Resolve Project Root
-#####################################
-
-CURRENT_DIR = pathlib.Path(__file__).resolve().parent
-
-# Locate the project root (folder containing /src)
-for parent in CURRENT_DIR.parents:
-    if (parent / "src").exists():
-        PROJECT_ROOT = parent
-        break
-else:
-    raise RuntimeError("Could not locate project root containing /src folder")
-
-SRC_DIR = PROJECT_ROOT / "src"
-sys.path.append(str(SRC_DIR))
-
-# Local logger
+# Package imports — the project installs with a src layout, so no
+# sys.path surgery is needed
+from analytics_project.data_prep.numeric_cleaning import parse_money
+from analytics_project.paths import prepared_data_dir, raw_data_dir
 from analytics_project.utils_logger import logger
 
 #####################################
-# Paths
+# Paths (resolved and mkdir'd once per process)
 #####################################
 
-DATA_DIR = PROJECT_ROOT / "data"
-RAW_DATA_DIR = DATA_DIR / "raw"
-PREPARED_DATA_DIR = DATA_DIR / "prepared"
-
-RAW_DATA_DIR.mkdir(exist_ok=True, parents=True)
-PREPARED_DATA_DIR.mkdir(exist_ok=True, parents=True)
+RAW_DATA_DIR = raw_data_dir()
+PREPARED_DATA_DIR = prepared_data_dir()
 
 #####################################
 # Functions
 #####################################
 
 
+# Explicit dtypes so the Arrow parser skips per-column type inference.
+# UnitPrice and Rating stay string because raw values may be invalid;
+# handle_missing_values / remove_invalid_ratings coerce them to numeric.
+PRODUCTS_DTYPES = {
+    "ProductID": "Int64",
+    "ProductName": "string[pyarrow]",
+    "Category": "string[pyarrow]",
+    "UnitPrice": "string[pyarrow]",
+    "Rating": "string[pyarrow]",
+    "Seasonal": "string[pyarrow]",
+}
+
+
 def read_raw_data(file_name: str) -> pd.DataFrame:
     logger.info(f"FUNCTION START: read_raw_data with {file_name}")
     file_path = RAW_DATA_DIR / file_name
     logger.info(f"Reading data from {file_path}")
 
-    df = pd.read_csv(file_path)
+    df = pd.read_csv(file_path, engine="pyarrow", dtype=PRODUCTS_DTYPES)
     logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
     return df
 
 
 def save_prepared_data(df: pd.DataFrame, file_name: str) -> None:
     logger.info(f"Saving prepared data with shape {df.shape}")
-    file_path = PREPARED_DATA_DIR / file_name
-    df.to_csv(file_path, index=False)
+    # Parquet: columnar binary with snappy compression — far faster than
+    # the single-threaded CSV text formatter, and smaller on disk
+    file_path = (PREPARED_DATA_DIR / file_name).with_suffix(".parquet")
+    df.to_parquet(file_path, engine="pyarrow", compression="snappy", index=False)
     logger.info(f"Saved cleaned data to {file_path}")
 
 
@@ -80,7 +76,7 @@ def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
     initial = len(df)
     subset = ["productid"] if "productid" in df.columns else None
 
-    df = df.drop_duplicates(subset=subset, keep="first")
+    df = df.drop_duplicates(subset=subset, keep="first", ignore_index=True)
     removed = initial - len(df)
 
     logger.info(f"Removed {removed} duplicate rows")
@@ -89,7 +85,8 @@ def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
 
 def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     logger.info("FUNCTION START: handle_missing_values")
-    logger.info(f"Missing before:\n{df.isna().sum()}")
+    # Lazy debug: the full-table isna scan only runs when DEBUG is on
+    logger.opt(lazy=True).debug("Missing before:\n{counts}", counts=lambda: df.isna().sum())
 
     # Drop rows missing ProductID
     if "productid" in df.columns:
@@ -103,13 +100,13 @@ def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
         if col in df.columns:
             df[col] = df[col].fillna("Unknown")
 
-    # Convert UnitPrice to numeric
+    # Convert UnitPrice to numeric in one compiled pass — commas are
+    # stripped and invalid or missing values become 0, with no
+    # intermediate string or NaN arrays
     if "unitprice" in df.columns:
-        df["unitprice"] = df["unitprice"].astype(str).str.replace(",", "", regex=False)
-        df["unitprice"] = pd.to_numeric(df["unitprice"], errors="coerce")
-        df["unitprice"] = df["unitprice"].fillna(0)
+        df["unitprice"] = parse_money(df["unitprice"])
 
-    logger.info(f"Missing after:\n{df.isna().sum()}")
+    logger.opt(lazy=True).debug("Missing after:\n{counts}", counts=lambda: df.isna().sum())
     return df
 
 
@@ -134,16 +131,19 @@ def remove_outliers(df: pd.DataFrame) -> pd.DataFrame:
 
     initial = len(df)
 
-    if "unitprice" in df.columns:
-        q1 = df["unitprice"].quantile(0.25)
-        q3 = df["unitprice"].quantile(0.75)
+    # Quantiles are undefined on an empty column — nothing to filter
+    # (remove_invalid_ratings may have dropped every row)
+    if "unitprice" in df.columns and not df.empty:
+        # One-pass quantiles plus an ndarray mask — no Series temporaries
+        arr = df["unitprice"].to_numpy()
+        q1, q3 = np.quantile(arr, [0.25, 0.75])
         iqr = q3 - q1
         lower = q1 - 1.5 * iqr
         upper = q3 + 1.5 * iqr
 
         logger.info(f"UnitPrice IQR bounds: {lower} to {upper}")
 
-        df = df[(df["unitprice"] >= lower) & (df["unitprice"] <= upper)]
+        df = df[(arr >= lower) & (arr <= upper)]
 
     removed = initial - len(df)
     logger.info(f"Removed {removed} outlier rows")
@@ -153,12 +153,27 @@ def remove_outliers(df: pd.DataFrame) -> pd.DataFrame:
 def standardize_formats(df: pd.DataFrame) -> pd.DataFrame:
     logger.info("FUNCTION START: standardize_formats")
 
+    # Cast to category first so string cleanup touches only the unique
+    # category values instead of every row.
+
     if "category" in df.columns:
-        df["category"] = df["category"].astype(str).str.strip().str.title()
+        cat = df["category"].astype("category")
+        categories = cat.cat.categories.astype(str).str.strip().str.title()
+        df["category"] = pd.Categorical(categories.take(cat.cat.codes))
 
+    # seasonal is binary — compare only the unique categories and rebuild
+    # with one np.where over the codes (missing code -1 falls through to "N")
     if "seasonal" in df.columns:
-        df["seasonal"] = df["seasonal"].astype(str).str.strip().str.upper()
-        df["seasonal"] = df["seasonal"].where(df["seasonal"].isin(["Y", "N"]), "N")
+        seasonal = df["seasonal"].astype("category")
+        is_y = seasonal.cat.categories.astype(str).str.strip().str.upper() == "Y"
+        codes = seasonal.cat.codes.to_numpy()
+        if is_y.size == 0:
+            # Entirely null column: zero categories, so take() has
+            # nothing to index — every row is "N"
+            mask = np.zeros(len(df), dtype=bool)
+        else:
+            mask = (codes >= 0) & is_y.take(codes, mode="clip")
+        df["seasonal"] = pd.Categorical(np.where(mask, "Y", "N"))
 
     return df
 
@@ -188,11 +203,16 @@ def main() -> None:
     output_file = "products_prepared.csv"
 
     df = read_raw_data(input_file)
+    if df.empty:
+        logger.error("No data loaded — exiting.")
+        return
+
     original_shape = df.shape
 
-    # Standardize column names
+    # Standardize column names — one list comprehension instead of three
+    # chained Index reallocations through StringMethods
     original_columns = df.columns.tolist()
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
     changed = [f"{o} -> {n}" for o, n in zip(original_columns, df.columns) if o != n]
 
     if changed:
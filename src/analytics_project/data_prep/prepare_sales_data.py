@@ -14,63 +14,66 @@ Cleans raw sales data:
 # IMPORTS
 #####################################
 
-import pathlib
-import sys
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
-#####################################
-# PROJECT ROOT RESOLUTION
-#####################################
-
-CURRENT_DIR = pathlib.Path(__file__).resolve().parent
-
-# Find the project root by locating folder that contains /src
-for parent in CURRENT_DIR.parents:
-    if (parent / "src").exists():
-        PROJECT_ROOT = parent
-        break
-else:
-    raise RuntimeError("Could not find project root containing /src folder")
-
-SRC_DIR = PROJECT_ROOT / "src"
-sys.path.append(str(SRC_DIR))
-
-# Local logger
+# Package imports — the project installs with a src layout, so no
+# sys.path surgery is needed
+from analytics_project.data_prep.numeric_cleaning import parse_money
+from analytics_project.paths import prepared_data_dir, raw_data_dir
 from analytics_project.utils_logger import logger
 
 #####################################
-# PATHS
+# PATHS (resolved and mkdir'd once per process)
 #####################################
 
-DATA_DIR = PROJECT_ROOT / "data"
-RAW_DATA_DIR = DATA_DIR / "raw"
-PREPARED_DATA_DIR = DATA_DIR / "prepared"
-
-RAW_DATA_DIR.mkdir(exist_ok=True, parents=True)
-PREPARED_DATA_DIR.mkdir(exist_ok=True, parents=True)
+RAW_DATA_DIR = raw_data_dir()
+PREPARED_DATA_DIR = prepared_data_dir()
 
 #####################################
 # FUNCTIONS
 #####################################
 
 
+# Explicit dtypes so the Arrow parser skips per-column type inference.
+# SaleAmount and ItemsPurchased stay string because raw values may be
+# invalid; the cleaning steps coerce them to numeric. SaleDate is left to
+# remove_invalid_dates since its M/D/YYYY format is not Arrow-parseable.
+SALES_DTYPES = {
+    "TransactionID": "Int64",
+    "SaleDate": "string[pyarrow]",
+    "CustomerID": "Int64",
+    "ProductID": "Int64",
+    "StoreID": "Int64",
+    "CampaignID": "float64",
+    "SaleAmount": "string[pyarrow]",
+    "ItemsPurchased": "string[pyarrow]",
+    "StoreCreditCard": "string[pyarrow]",
+}
+
+
 def read_raw_data(file_name: str) -> pd.DataFrame:
     logger.info(f"Reading raw data: {file_name}")
     path = RAW_DATA_DIR / file_name
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, engine="pyarrow", dtype=SALES_DTYPES)
     logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
     return df
 
 
 def save_prepared_data(df: pd.DataFrame, file_name: str) -> None:
-    path = PREPARED_DATA_DIR / file_name
-    df.to_csv(path, index=False)
+    # Parquet: columnar binary with snappy compression — far faster than
+    # the single-threaded CSV text formatter, and smaller on disk
+    path = (PREPARED_DATA_DIR / file_name).with_suffix(".parquet")
+    df.to_parquet(path, engine="pyarrow", compression="snappy", index=False)
     logger.info(f"Saved cleaned data to {path}")
 
 
 def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     original_cols = df.columns.tolist()
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+    # Column counts are tiny — a plain list comprehension beats three
+    # chained Index reallocations through StringMethods
+    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
     changed = [f"{o} -> {n}" for o, n in zip(original_cols, df.columns) if o != n]
     if changed:
         logger.info(f"Renamed columns: {changed}")
@@ -79,7 +82,10 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
 
 def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
     initial = len(df)
-    df = df.drop_duplicates(subset=["transactionid"], keep="first")
+    # Stable pre-sort on the key gives the dedup hash table better locality
+    # and makes the output ordering deterministic.
+    df = df.sort_values("transactionid", kind="stable")
+    df = df.drop_duplicates(subset=["transactionid"], keep="first", ignore_index=True)
     logger.info(f"Removed {initial - len(df)} duplicate rows")
     return df
 
@@ -92,75 +98,77 @@ def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     df = df.dropna(subset=["transactionid", "customerid", "productid"])
     logger.info(f"Dropped {before - len(df)} rows missing critical IDs")
 
-    # Fix StoreCreditCard
+    # Fix StoreCreditCard — the column is binary, so compare only the
+    # unique categories and rebuild with one np.where over the codes
+    # (missing values have code -1 and fall through to "N")
     if "storecreditcard" in df.columns:
-        df["storecreditcard"] = df["storecreditcard"].astype(str).str.upper()
-        df["storecreditcard"] = df["storecreditcard"].where(
-            df["storecreditcard"].isin(["Y", "N"]), "N"
-        )
+        card = df["storecreditcard"].astype("category")
+        is_y = card.cat.categories.astype(str).str.upper() == "Y"
+        codes = card.cat.codes.to_numpy()
+        if is_y.size == 0:
+            # Entirely null column: zero categories, so take() has
+            # nothing to index — every row is "N"
+            mask = np.zeros(len(df), dtype=bool)
+        else:
+            mask = (codes >= 0) & is_y.take(codes, mode="clip")
+        df["storecreditcard"] = pd.Categorical(np.where(mask, "Y", "N"))
 
     return df
 
 
-def remove_invalid_dates(df: pd.DataFrame) -> pd.DataFrame:
-    logger.info("Removing invalid dates")
+# Each _*_mask helper converts its column in place and returns a boolean
+# ndarray of rows to keep. main() ANDs the masks together and copies the
+# surviving rows once, instead of materializing a filtered DataFrame per
+# validation step.
 
-    before = len(df)
 
-    # Convert dates
-    df["saledate"] = pd.to_datetime(df["saledate"], errors="coerce")
+def _valid_dates_mask(df: pd.DataFrame) -> np.ndarray:
+    # Convert dates — explicit format stays on the fast C parse path and
+    # cache=True makes repeated date strings parse once per unique value
+    df["saledate"] = pd.to_datetime(
+        df["saledate"], format="%m/%d/%Y", errors="coerce", cache=True
+    )
 
-    df = df.dropna(subset=["saledate"])
+    mask = df["saledate"].notna().to_numpy()
+    logger.info(f"Flagged {len(df) - mask.sum()} rows with invalid dates")
+    return mask
 
-    logger.info(f"Removed {before - len(df)} rows with invalid dates")
-    return df
 
+def _valid_amounts_mask(df: pd.DataFrame) -> np.ndarray:
+    # Convert SaleAmount in one compiled pass; invalid parses as 0 and
+    # fails the > 0 check along with zero and negative amounts
+    df["saleamount"] = parse_money(df["saleamount"])
 
-def remove_invalid_amounts(df: pd.DataFrame) -> pd.DataFrame:
-    logger.info("Removing invalid amounts")
+    mask = df["saleamount"].to_numpy() > 0
+    logger.info(f"Flagged {len(df) - mask.sum()} rows with invalid SaleAmount")
+    return mask
 
-    # Convert SaleAmount, invalid = NaN
-    df["saleamount"] = pd.to_numeric(df["saleamount"], errors="coerce")
-
-    before = len(df)
-
-    # Remove NaN, Zero, Negative
-    df = df[df["saleamount"] > 0]
-
-    logger.info(f"Removed {before - len(df)} rows with invalid SaleAmount")
-    return df
-
-
-def remove_invalid_items(df: pd.DataFrame) -> pd.DataFrame:
-    logger.info("Removing rows with invalid ItemsPurchased")
-
-    before = len(df)
 
+def _valid_items_mask(df: pd.DataFrame) -> np.ndarray:
     df["itemspurchased"] = pd.to_numeric(df["itemspurchased"], errors="coerce")
-    df = df[df["itemspurchased"] > 0]
-
-    logger.info(f"Removed {before - len(df)} invalid item count rows")
-    return df
 
+    mask = (df["itemspurchased"] > 0).to_numpy()
+    logger.info(f"Flagged {len(df) - mask.sum()} invalid item count rows")
+    return mask
 
-def remove_outliers(df: pd.DataFrame) -> pd.DataFrame:
-    logger.info("Removing outliers using IQR")
 
-    initial = len(df)
-
-    if "saleamount" in df.columns:
-        q1 = df["saleamount"].quantile(0.25)
-        q3 = df["saleamount"].quantile(0.75)
-        iqr = q3 - q1
-        lower = q1 - 1.5 * iqr
-        upper = q3 + 1.5 * iqr
+def _outlier_mask(df: pd.DataFrame, valid: np.ndarray) -> np.ndarray:
+    # No rows left valid — quantiles are undefined on an empty slice, and
+    # the final filter drops everything regardless
+    if not valid.any():
+        logger.info("No valid rows remain — skipping outlier bounds")
+        return valid
 
-        logger.info(f"Outlier bounds for SaleAmount: {lower} to {upper}")
+    # IQR bounds come from the rows still considered valid so invalid
+    # zero amounts don't skew the quantiles
+    arr = df["saleamount"].to_numpy()
+    q1, q3 = np.quantile(arr[valid], [0.25, 0.75])
+    iqr = q3 - q1
+    lower = q1 - 1.5 * iqr
+    upper = q3 + 1.5 * iqr
 
-        df = df[(df["saleamount"] >= lower) & (df["saleamount"] <= upper)]
-
-    logger.info(f"Removed {initial - len(df)} outlier rows")
-    return df
+    logger.info(f"Outlier bounds for SaleAmount: {lower} to {upper}")
+    return (arr >= lower) & (arr <= upper)
 
 
 def standardize_formats(df: pd.DataFrame) -> pd.DataFrame:
@@ -170,7 +178,10 @@ def standardize_formats(df: pd.DataFrame) -> pd.DataFrame:
         df["storeid"] = df["storeid"].astype(int)
 
     if "campaignid" in df.columns:
-        df["campaignid"] = pd.to_numeric(df["campaignid"], errors="coerce").fillna(0)
+        # Arrow cast + fill_null does the coerce-and-fill in one kernel
+        # instead of to_numeric followed by fillna
+        arr = pa.array(df["campaignid"]).cast(pa.float64(), safe=False)
+        df["campaignid"] = arr.fill_null(0.0).to_numpy()
 
     return df
 
@@ -189,15 +200,26 @@ def main() -> None:
     OUTPUT = "sales_prepared.csv"
 
     df = read_raw_data(INPUT)
+    if df.empty:
+        logger.error("No data loaded — exiting.")
+        return
+
     original_shape = df.shape
 
     df = clean_column_names(df)
     df = remove_duplicates(df)
     df = handle_missing_values(df)
-    df = remove_invalid_dates(df)
-    df = remove_invalid_amounts(df)
-    df = remove_invalid_items(df)
-    df = remove_outliers(df)
+
+    # Accumulate one keep-mask across all validity checks, then copy the
+    # surviving rows a single time
+    mask = _valid_dates_mask(df)
+    # First & allocates a fresh writable array (notna's can be read-only)
+    mask = mask & _valid_amounts_mask(df)
+    mask &= _valid_items_mask(df)
+    mask &= _outlier_mask(df, mask)
+    logger.info(f"Removing {len(df) - mask.sum()} invalid/outlier rows in one pass")
+    df = df.loc[mask].reset_index(drop=True)
+
     df = standardize_formats(df)
 
     save_prepared_data(df, OUTPUT)
@@ -72,6 +72,18 @@ logger.info(f"WAREHOUSE_DIR:       {WAREHOUSE_DIR}")
 logger.info(f"DB_PATH:             {DB_PATH}")
 
 
+def read_prepared_data(file_name: str) -> pd.DataFrame:
+    """Read a prepared table, preferring Parquet over the legacy CSV.
+
+    The prepare scripts write Parquet (columnar, ~10x faster to load);
+    fall back to CSV for older prepared data.
+    """
+    parquet_path = (CLEAN_DATA_DIR / file_name).with_suffix(".parquet")
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    return pd.read_csv(CLEAN_DATA_DIR / file_name)
+
+
 def create_schema(cursor: sqlite3.Cursor) -> None:
     """Create tables in the data warehouse if they don't exist."""
 
@@ -166,11 +178,11 @@ def load_data_to_db() -> None:
         create_schema(cursor)
         delete_existing_records(cursor)
 
-        # Load prepared data using pandas
-        customers_df = pd.read_csv(CLEAN_DATA_DIR.joinpath("customers_prepared.csv"))
-        products_df = pd.read_csv(CLEAN_DATA_DIR.joinpath("products_prepared.csv"))
+        # Load prepared data using pandas (Parquet preferred, CSV fallback)
+        customers_df = read_prepared_data("customers_prepared.csv")
+        products_df = read_prepared_data("products_prepared.csv")
         # Uncomment after implementing sales data preparation
-        sales_df = pd.read_csv(CLEAN_DATA_DIR.joinpath("sales_prepared.csv"))
+        sales_df = read_prepared_data("sales_prepared.csv")
 
         # Rename clean columns to match database schema if necessary
         # Clean column name : Database column name
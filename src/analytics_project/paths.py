@@ -0,0 +1,58 @@
+"""Provide cached project path resolution for data pipeline scripts.
+
+Each prepare script used to walk the parent directories looking for the
+project root and call mkdir on the data folders at import time. These
+helpers do that work once per process and cache the result, so importing
+several pipeline modules (or spawning worker processes) pays the
+filesystem cost a single time.
+
+Module Information:
+    - Filename: paths.py
+    - Module: paths
+    - Location: src/analytics_project/
+"""
+
+import functools
+import pathlib
+
+
+@functools.lru_cache(maxsize=1)
+def project_root() -> pathlib.Path:
+    """Find the project root by walking up until a folder contains /src.
+
+    Returns:
+        pathlib.Path: The resolved project root directory.
+
+    Raises:
+        RuntimeError: If no parent directory contains a /src folder.
+    """
+    here = pathlib.Path(__file__).resolve()
+    for parent in here.parents:
+        if (parent / "src").exists():
+            return parent
+    raise RuntimeError("Could not find project root containing /src folder")
+
+
+@functools.lru_cache(maxsize=1)
+def data_dir() -> pathlib.Path:
+    """Return the project data directory."""
+    return project_root() / "data"
+
+
+@functools.lru_cache(maxsize=1)
+def raw_data_dir() -> pathlib.Path:
+    """Return data/raw, creating it on first call only."""
+    path = data_dir() / "raw"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def prepared_data_dir() -> pathlib.Path:
+    """Return data/prepared, creating it on first call only."""
+    path = data_dir() / "prepared"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+__all__ = ["data_dir", "prepared_data_dir", "project_root", "raw_data_dir"]
@@ -0,0 +1,65 @@
+"""Test the single-pass numeric parser in numeric_cleaning.
+
+Module Information:
+    - Filename: test_numeric_cleaning.py
+    - Module: test_numeric_cleaning
+    - Location: tests/
+
+parse_money replaced a str.replace(",")/to_numeric/fillna(0) chain, so
+these tests pin parity with that chain on the edge forms it accepted:
+surrounding whitespace, a leading +, scientific notation, commas, and
+invalid or missing values.
+"""
+
+import numpy as np
+import pandas as pd
+
+from analytics_project.data_prep.numeric_cleaning import parse_money
+
+
+def legacy_clean(series: pd.Series) -> pd.Series:
+    """The chain parse_money replaced in the prepare scripts."""
+    cleaned = series.astype(str).str.replace(",", "", regex=False)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0).astype("float64")
+
+
+EDGE_VALUES = [
+    "1,234",  # thousands separator
+    " 12",  # leading whitespace
+    "12 ",  # trailing whitespace
+    "\t12\n",  # other whitespace
+    "+5",  # leading plus
+    " +3.14 ",  # plus with whitespace
+    "1e3",  # scientific notation
+    "2.5E-2",  # negative exponent, uppercase E
+    "1e+2",  # explicit positive exponent
+    "-9,000.5",  # sign plus separator plus decimal
+    "56.78",  # plain float
+    "0",  # zero
+    "abc",  # junk
+    "12.5.6",  # two decimal points
+    "1e",  # exponent with no digits
+    "",  # empty string
+    None,  # missing
+]
+
+
+def test_parity_with_legacy_chain():
+    """parse_money matches the old to_numeric chain on edge forms."""
+    series = pd.Series(EDGE_VALUES, dtype=object)
+    result = parse_money(series)
+    expected = legacy_clean(series).to_numpy()
+    np.testing.assert_allclose(result, expected)
+
+
+def test_invalid_and_missing_parse_to_zero():
+    """Junk and missing values become 0.0, matching the old fillna(0)."""
+    series = pd.Series(["abc", "", None, "1-2"], dtype=object)
+    assert parse_money(series).tolist() == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_empty_series():
+    """An empty column parses to an empty float array."""
+    result = parse_money(pd.Series([], dtype="string"))
+    assert result.size == 0
+    assert result.dtype == np.float64